@@ -7,197 +7,289 @@ Current features:
     (3) Point Group symmetry
 """
 
+import os
 import sys
 import re
-import pandas as pd
-
-# Reference
-def get_reference(f):
-    for line in f:
-        if "REFERENCE ENERGY:     " in line:
-            x = line.split()
-            break
-            
-    return x[2]
+import glob
+import json
+import hashlib
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import dataclass, field, asdict
+import numpy as np
+
+# GAMESS output is plain ASCII, so the file is read as bytes and every
+# pattern below is a bytes pattern; only extracted tokens get decoded.
+
+# MO block headers open their line once leading blanks are stripped, so a
+# C-level startswith on the uppercased line detects them.
+_MO_PREFIXES = (b"EIGENVECTOR", b"MOLECULAR ORBITALS")
+# One alternation over the other markers, which may sit anywhere in the line
+_RE_SCAN = re.compile(
+    rb"(?P<ref>REFERENCE ENERGY:)"
+    rb"|(?P<ccsd>CCSD ENERGY:)"
+    rb"|(?P<pg>THE POINT GROUP OF THE MOLECULE IS )"
+    rb"|(?P<axis>THE ORDER OF THE PRINCIPAL AXIS IS )"
+    rb"|(?P<calc>(?i:BEGINNING\s+(?P<calc_name>.*?)\s+ITERATIONS\s+FOR\s+STATE\s+\d+))"
+    rb"|(?P<summary>(?i:SUMMARY\s+OF\s+.*EOMCC\s+CALCULATIONS))"
+    rb"|(?P<amp>(?i:NO\.\s+\d+\s+SELECTED STATE:\s+\d+\s+EIGENVALUE:))"
+)
+_RE_EOM_STATE = re.compile(rb"^\s*(\d+)\s+(\d+)\s+([-\d\.]+)\s+([-\d\.]+)\s+CONVERGED", re.IGNORECASE)
+_RE_IRREP = re.compile(rb"^[AB]\d?[g-uG-U](?:\(\d+\))?$")
+# A stripped line made only of decimal numbers (D or E exponents allowed);
+# each number carries exactly one '.'
+_RE_FLOAT_LINE = re.compile(
+    rb"^[-+]?\d+\.\d+(?:[DEe][-+]?\d+)?(?:\s+[-+]?\d+\.\d+(?:[DEe][-+]?\d+)?)*$"
+)
+# Fortran D exponents -> E, applied to whole blocks of MO energies at once
+_D_TO_E = bytes.maketrans(b'D', b'E')
+
+@dataclass
+class Results:
+    """Everything extracted from one pass over a GAMESS output."""
+    ref_e: str = None
+    ccsd_e: str = None
+    ccsd_corr: str = None
+    pg: str = None
+    axis_order: str = None
+    # MOs as parallel arrays: float64 energies and int8 indices into irrep_labels
+    mo_energies: np.ndarray = None
+    mo_irrep_ids: np.ndarray = None
+    irrep_labels: list = field(default_factory=list)
+    eom_requested: bool = False
+    calc: str = None
+    eom_states: list = field(default_factory=list)
+    amps: list = field(default_factory=list)
+    # Printed by report() with the amplitudes, so they survive the cache
+    warnings: list = field(default_factory=list)
+
+# One EOM state from the summary, with the amplitudes of its selected state
+EomState = namedtuple('EomState', 'state mult omega total amps')
+
+def _line_is_irrep_list(line):
+    tokens = line.strip().split()
+    if not tokens:
+        return False
+    for tok in tokens:
+        if not _RE_IRREP.match(tok):
+            return False
+    return True
 
-def parse_mo_data(f):
+def scan_output(f):
     """
-    Parse the MO energies and irreps from the EIGENVECTOR or MOLECULAR ORBITALS block.
-    Returns: (mo_energies, mo_irreps), where each is a list.
+    Walk the output once, handing each line to the extractor whose marker it
+    contains. One alternation regex with named groups picks the extractor, so
+    the file is traversed a single time instead of once per quantity.
+    `f` may be any iterable of lines; an open file is streamed, never
+    loaded whole, and no line is ever looked up by index.
+    Returns: Results
     """
-    # Regex helpers
-    irreps_pattern = re.compile(r"^[AB]\d?[g-uG-U](?:\(\d+\))?$")
-
-    def parse_float_line(line):
-        """Try parsing a line of floats (replacing D with E for exponents)."""
-        tokens = line.split()
-        floats = []
-        for t in tokens:
-            t_for_exp = t.replace('D', 'E')
-            try:
-                val = float(t_for_exp)
-                floats.append(val)
-            except ValueError:
-                return None
-        return floats
-
-    def line_is_irrep_list(line):
-        tokens = line.strip().split()
-        if not tokens:
-            return False
-        for tok in tokens:
-            if not irreps_pattern.match(tok):
-                return False
-        return True
-
-    mo_energies = []
-    mo_irreps = []
-
+    res = Results()
     in_mo_block = False
     energies_buffer = None
+    # Raw energy rows that were paired with irreps; converted in one go
+    energy_rows = []
+    # Irrep id of every paired MO, and the id given to each irrep seen
+    irrep_ids = []
+    irrep_index = {}
+    in_eom_summary = False
+    # Lines left until the amplitudes under the last SELECTED STATE header
+    amp_pending = 0
+    amp_header = None
 
     for line in f:
+        if amp_pending:
+            amp_pending -= 1
+            if not amp_pending:
+                extracted_info = line.split(b':')[0].split()
+                res.amps.append([int(element[:-1]) for element in extracted_info])
+
         upper_line = line.upper()
 
-        # Detect beginning of MO block
-        if ("EIGENVECTOR" in upper_line) or ("MOLECULAR ORBITALS" in upper_line):
+        # further parsing: $EOMINP is echoed with the input as the user typed
+        # it, so look for it in the uppercased line until it has been seen
+        if not res.eom_requested and upper_line.find(b'EOMINP') >= 0:
+            res.eom_requested = True
+
+        if upper_line.lstrip().startswith(_MO_PREFIXES):
+            # Detect beginning of MO block
             in_mo_block = True
             energies_buffer = None
             continue
 
+        # Every _RE_SCAN marker contains one of these literals; checking them
+        # first (bytes.find is much cheaper than "in" on bytes) keeps the
+        # alternation off almost all lines. Markers whose value is already
+        # settled drop out of the check.
+        m = None
+        if (((res.ref_e is None or res.ccsd_e is None) and upper_line.find(b"ENERGY:") >= 0)
+                or (res.axis_order is None and (upper_line.find(b"POINT GROUP") >= 0
+                                                or upper_line.find(b"PRINCIPAL AXIS") >= 0))
+                or (res.calc is None and upper_line.find(b"ITERATIONS") >= 0)
+                or upper_line.find(b"EOMCC") >= 0 or upper_line.find(b"SELECTED STATE:") >= 0):
+            m = _RE_SCAN.search(line)
+        if m:
+            key = m.lastgroup
+            if key == 'ref':
+                # Reference: first occurrence only
+                if res.ref_e is None:
+                    res.ref_e = line.split()[2].decode('ascii')
+            elif key == 'ccsd':
+                # CCSD: first occurrence only
+                if res.ccsd_e is None:
+                    x = line.split()
+                    res.ccsd_e, res.ccsd_corr = x[2].decode('ascii'), x[5].decode('ascii')
+            elif key == 'pg':
+                # Point group: last one printed before the principal axis
+                if res.axis_order is None:
+                    res.pg = line.split()[7].decode('ascii')
+            elif key == 'axis':
+                if res.axis_order is None:
+                    res.axis_order = line.split()[7].decode('ascii')
+            elif key == 'calc':
+                # Type of Calculation
+                if res.calc is None:
+                    res.calc = m.group('calc_name').decode('ascii')
+            elif key == 'summary':
+                # Detect EOM summary block
+                in_eom_summary = True
+            elif key == 'amp':
+                # Amplitudes sit on the third line of the block
+                amp_pending = 2
+                amp_header = line
+            continue
+
+        if in_eom_summary:
+            m_eom = _RE_EOM_STATE.match(line)
+            if m_eom:
+                st_idx = int(m_eom.group(1))
+                sp_mult = int(m_eom.group(2))
+                ion_en = float(m_eom.group(3))
+                tot_en = float(m_eom.group(4))
+                res.eom_states.append((st_idx, sp_mult, ion_en, tot_en))
+            elif not line.strip():
+                # blank line => maybe the summary ended
+                in_eom_summary = False
+
         if in_mo_block:
             raw = line.strip()
             if not raw:
                 # blank line => skip
                 continue
 
-            # Try to parse a line of floats
-            float_vals = parse_float_line(raw)
-            if float_vals is not None and len(float_vals) > 0:
-                energies_buffer = float_vals
+            # Keep a line of floats as raw bytes; it is converted later
+            if _RE_FLOAT_LINE.match(raw):
+                energies_buffer = raw
                 continue
 
             # If line looks like a list of irreps
-            if line_is_irrep_list(raw):
+            if _line_is_irrep_list(raw):
                 tokens = raw.split()
                 # Only extend if energies_buffer and irreps have the same length
-                if energies_buffer and len(tokens) == len(energies_buffer):
-                    mo_energies.extend(energies_buffer)
-                    mo_irreps.extend(tokens)
+                # (one '.' per validated number)
+                if energies_buffer and len(tokens) == energies_buffer.count(b'.'):
+                    energy_rows.append(energies_buffer)
+                    irrep_ids.extend(irrep_index.setdefault(tok, len(irrep_index)) for tok in tokens)
                 energies_buffer = None
-                continue
-
-    return mo_energies, mo_irreps
-
-# CCSD
-def get_ccsd(f):
-    for line in f:
-        if "CCSD ENERGY:" in line:
-            x = line.split()
-            break
-            
-    return x[2],x[5]
-
-# Point Group
-def get_pointgroup(f):
-    for line in f:
-        if "THE POINT GROUP OF THE MOLECULE IS " in line:
-            x = line.split()
-        elif "THE ORDER OF THE PRINCIPAL AXIS IS " in line:
-            y = line.split()
-            break
-    
-    pg = x[7]
-    pg = pg.replace("N",y[7])
-     
-    return pg
 
-# further parsing
-def proceed_further(f):
-    for line in f:
-        if 'eominp' or 'EOMINP' in line:
-            return True
-    else:
-        return False   
-    
-# Type of Calculation
-def get_calc(f):
-    pattern = re.compile(r"BEGINNING\s+(.*?)\s+ITERATIONS\s+FOR\s+STATE\s+(\d+)", re.IGNORECASE)
-    for line in f:
-        match=pattern.search(line)
-        if match:
-            info=match.group(1)
-            break
-               
-    return info
-
-def parse_eom_states(f):
+    # All MO energies in a single C-level parse
+    res.mo_energies = np.fromstring(b' '.join(energy_rows).translate(_D_TO_E), sep=' ')
+    res.mo_irrep_ids = np.array(irrep_ids, dtype=np.int8)
+    res.irrep_labels = [tok.decode('ascii') for tok in irrep_index]
+
+    if amp_pending:
+        res.warnings.append(f"[WARNING] Matched line '{amp_header.strip().decode('ascii')}' does not have two lines following it.")
+
+    # Replace 'N' in the point group with the order of the principal axis
+    if res.pg and res.axis_order:
+        res.pg = res.pg.replace("N", res.axis_order)
+
+    return res
+
+# Parse cache: one JSON file of Results per (path, size, mtime) of an output
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gamess-parse')
+# Default cap on stored entries; sized for batches of thousands of outputs
+_CACHE_MAX_ENTRIES = 4096
+# Part of every cache key; bump it whenever scan_output or the Results layout
+# changes so entries written by an older parser are never served
+_CACHE_VERSION = 2
+
+def cache_path(filename):
+    """Cache file for the current contents of `filename` (OSError if missing)."""
+    st = os.stat(filename)
+    key = f"{_CACHE_VERSION}|{os.path.abspath(filename)}|{st.st_size}|{st.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{digest}.json")
+
+def load_cached(path):
+    """Results stored at `path`, or None if there is no usable entry."""
+    try:
+        with open(path, 'r') as fh:
+            res = Results(**json.load(fh))
+        res.mo_energies = np.asarray(res.mo_energies, dtype=np.float64)
+        res.mo_irrep_ids = np.asarray(res.mo_irrep_ids, dtype=np.int8)
+    except (OSError, ValueError, TypeError):
+        return None
+    try:
+        # mark as recently used; atime is unreliable on relatime mounts
+        os.utime(path)
+    except OSError:
+        # e.g. a read-only shared cache: the entry is still good
+        pass
+    return res
+
+def save_cached(path, res):
+    """Store `res` at `path`; eviction is left to prune_cache."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as fh:
+            data = asdict(res)
+            data['mo_energies'] = res.mo_energies.tolist()
+            data['mo_irrep_ids'] = res.mo_irrep_ids.tolist()
+            json.dump(data, fh)
+        os.replace(tmp, path)
+    except OSError:
+        # the cache is only an optimization
+        pass
+
+def prune_cache(filenames, max_entries=_CACHE_MAX_ENTRIES):
     """
-    Parse the EOM states (for DIP-EOM, DEA-EOM, IP-EOM, EA-EOM, etc.).
-    Returns: a list of tuples (state_index, spin, ion_en, total_en).
+    Evict the least recently used entries until at most `max_entries` remain.
+    Entries of `filenames` (the outputs of the current run) are never evicted,
+    so a batch larger than the cap keeps all of its own results.
     """
-    re_eom_summary_begin = re.compile(r"SUMMARY\s+OF\s+.*EOMCC\s+CALCULATIONS", re.IGNORECASE)
-    re_eom_state = re.compile(r"^\s*(\d+)\s+(\d+)\s+([-\d\.]+)\s+([-\d\.]+)\s+CONVERGED", re.IGNORECASE)
-
-    eom_states = []
-    in_eom_summary = False
-
-    for line in f:
-        # Detect EOM summary block
-        if re_eom_summary_begin.search(line):
-            in_eom_summary = True
-            continue
-
-        if in_eom_summary:
-            m_eom = re_eom_state.match(line)
-            if m_eom:
-                st_idx = int(m_eom.group(1))
-                sp_mult = int(m_eom.group(2))
-                ion_en = float(m_eom.group(3))
-                tot_en = float(m_eom.group(4))
-                eom_states.append((st_idx, sp_mult, ion_en, tot_en))
-            elif not line.strip():
-                # blank line => maybe the summary ended
-                in_eom_summary = False
-
-    return eom_states
-
-# get amplitudes
-def get_amplitudes(f):
-    matches = []
-    # Regex pattern to match the specified line
-    pattern = re.compile(r"NO\.\s+\d+\s+SELECTED STATE:\s+\d+\s+EIGENVALUE:", re.IGNORECASE)
-    counter=0
-    for idx, line in enumerate(f):
-        if pattern.search(line):
-            target_line_num = idx + 2  # Third line after the matched line
-            counter += 1
-            if target_line_num < len(f):
-                extracted_info1 = f[target_line_num].split(':')
-                extracted_info1.pop()
-                extracted_info1 = list(extracted_info1)
-                extracted_info2 = extracted_info1[0].split()
-                amps=[]
-                for element in extracted_info2:
-                    # extracted_info.pop()
-                    amps.append(int(element[:-1]))
-                    
-                matches.append((amps))  # (Matched Line Number, Extracted Info)
-                # print(f"[DEBUG] Found match on line {idx + 1}. Extracted info from line {target_line_num + 1}: {amps}")
-            else:
-                print(f"[WARNING] Matched line {idx + 1} does not have two lines following it.")
-    
-    if not matches:
-        print("No 'NO.   XX SELECTED STATE:    XX EIGENVALUE:' lines found.")
-    
-    return matches
+    keep = set()
+    for filename in filenames:
+        try:
+            keep.add(cache_path(filename))
+        except OSError:
+            pass
+    try:
+        entries = [os.path.join(_CACHE_DIR, name) for name in os.listdir(_CACHE_DIR)
+                   if name.endswith('.json')]
+        excess = len(entries) - max_entries
+        if excess <= 0:
+            return
+        candidates = [entry for entry in entries if entry not in keep]
+        candidates.sort(key=os.path.getmtime)
+        for old in candidates[:excess]:
+            os.remove(old)
+    except OSError:
+        # the cache is only an optimization
+        pass
 
 def create_character_table(point_group_name, irreps, operations, characters):
-    data = {op: chars for op, chars in zip(operations, zip(*characters))}
-    df = pd.DataFrame(data, index=irreps)
-    return df
+    """
+    Character table as an int8 array (rows follow `irreps`, columns follow
+    `operations`) plus an {irrep: row} lookup.
+    """
+    table = np.array(characters, dtype=np.int8)
+    return table, {irrep: i for i, irrep in enumerate(irreps)}
 
-def get_product(point_group, irrep1, irrep2):
+def build_character_tables():
     # Define character tables
     character_tables = {}
 
@@ -291,50 +383,70 @@ def get_product(point_group, irrep1, irrep2):
     ]
     D2h = create_character_table('D2H', D2h_irr, D2h_ops, D2h_chars)
     character_tables['D2H'] = D2h
-    if point_group not in character_tables:
+    return character_tables
+
+# Built once at import: point group -> (characters, {irrep: row})
+CHAR_TABLES = build_character_tables()
+
+def get_product(point_group, irrep1, irrep2):
+    if point_group not in CHAR_TABLES:
         print(f"Point group '{point_group}' not found.")
         return None
     
-    table = character_tables[point_group]
+    table, index = CHAR_TABLES[point_group]
     
-    if irrep1 not in table.index or irrep2 not in table.index:
+    if irrep1 not in index or irrep2 not in index:
         print(f"One or both irreps '{irrep1}', '{irrep2}' not found in point group '{point_group}'.")
         return None
     
-    # Get characters for both irreps
-    chars1 = table.loc[irrep1]
-    chars2 = table.loc[irrep2]
-    
+    return dict(_decompose_product(point_group, irrep1, irrep2))
+
+@lru_cache(maxsize=None)
+def _decompose_product(point_group, irrep1, irrep2):
+    """
+    Decomposition of irrep1 x irrep2 as a tuple of (irrep, multiplicity).
+    There are only a few hundred valid inputs, so each is computed once
+    and every later call is a cache hit with no NumPy dispatch.
+    """
+    table, index = CHAR_TABLES[point_group]
+
     # Multiply characters element-wise
-    product_chars = chars1 * chars2
+    product_chars = table[index[irrep1]] * table[index[irrep2]]
     
     # Decompose the product into irreps
-    decomposition = {}
-    for irrep in table.index:
-        # Calculate the inner product (sum of products divided by group order)
-        inner_product = sum(product_chars * table.loc[irrep]) / len(product_chars)
-        if inner_product > 0:
-            decomposition[irrep] = int(inner_product)
-    
-    return decomposition
-        
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: ./parse-gamess-output.py <gamess_output_file>")
-        sys.exit(1)
+    # (inner product with every irrep at once, divided by group order)
+    sums = table @ product_chars
+    order = table.shape[1]
+    decomposition = []
+    for irrep, row in index.items():
+        if sums[row] > 0:
+            decomposition.append((irrep, int(sums[row]) // order))
+
+    return tuple(decomposition)
         
-    filename = sys.argv[1]
-    
+def parse_one(filename, use_cache=True):
+    """
+    Results for one output file, taken from the parse cache when possible.
+    Returns: (Results, None) or (None, error message)
+    """
     try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            f = file.readlines()
+        cached = cache_path(filename) if use_cache else None
+        res = load_cached(cached) if cached else None
+        if res is None:
+            # 64 KiB reads: the output is consumed strictly sequentially
+            with open(filename, 'rb', buffering=65536) as file:
+                # walk the output once and collect everything
+                res = scan_output(file)
+            if cached:
+                save_cached(cached, res)
     except FileNotFoundError:
-        print(f"Error: File not found - {filename}")
-        sys.exit(1)
+        return None, f"Error: File not found - {filename}"
     except Exception as e:
-        print(f"An error occurred while reading the file: {e}")
-        sys.exit(1)
-    
+        return None, f"An error occurred while reading the file: {e}"
+    return res, None
+
+def report(filename, res):
+    """Print the parsing report for one output file."""
     print("")
     print("==== GAMESS OUTPUT PARSING SCRIPT ====")
     print("")
@@ -342,55 +454,94 @@ def main():
     print("")
     #  
     # extract the reference energy
-    ref_e = get_reference(f)
+    ref_e = res.ref_e
     print(f"REFERENCE ENERGY:  {ref_e} Hartree")
     #
     # extract point group symmetry
-    pg = get_pointgroup(f) 
+    pg = res.pg
     print(f"POINT GROUP SYMMETRY: {pg}")
     #
     # Print MO energies & irreps
-    energies, irreps = parse_mo_data(f)
+    energies, irreps, labels = res.mo_energies, res.mo_irrep_ids, res.irrep_labels
     print("\nMolecular Orbitals (energy + irrep):")
     n = min(len(energies), len(irreps))
     if n == 0:
         print("No MO data found (or recognized) in the output.")
     else:
         for i in range(n):
-            print(f" MO #{i+1:2d}:  Energy = {energies[i]:10.5f}  Irrep = {irreps[i]}")
+            print(f" MO #{i+1:2d}:  Energy = {energies[i]:10.5f}  Irrep = {labels[irreps[i]]}")
     #
     # extract CCSD energy
-    ccsd_e, ccsd_corr = get_ccsd(f)
+    ccsd_e, ccsd_corr = res.ccsd_e, res.ccsd_corr
     print(f"CCSD ENERGY:        {ccsd_e} Hartree  CORR. E: {ccsd_corr} Hartree")
     
     # Check if further parsing is needed
-    stat = proceed_further(f)
-    if stat:
+    if res.eom_requested:
         print("EXCITED STATE CALCULATION WAS PERFORMED")
     else:
         print("DONE WITH ALL PARSING")
-        sys.exit(0)
+        return
         
     print("proceeding with further extractions.")
-    calc = get_calc(f)
+    calc = res.calc
     print(f"{calc} calculation performed")
     
     # Print EOM states
-    eom_states=parse_eom_states(f)
-    amps = get_amplitudes(f)
+    eom_states = res.eom_states
+    amps = res.amps
+    for warning in res.warnings:
+        print(warning)
+    if not amps:
+        print("No 'NO.   XX SELECTED STATE:    XX EIGENVALUE:' lines found.")
     print("*****************************")
     st = get_product(pg,'B1U','B3G')
     print(st)
 
     # print(eom_states)
     print(f"=== {calc} States (for DIP, DEA, IP, EA, etc.) ===")
-    cols=['State', 'mult', 'omega (H)', 'Total E (H)']
-    df_eom=pd.DataFrame(eom_states, columns=cols)
-    # print(df_eom)
-    df_eom['amplitudes']=amps
-    # print(df_eom)
-                 
-         
+    eom_table = [EomState(*row, amp) for row, amp in zip(eom_states, amps)]
+    # print(eom_table)
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse GAMESS output files.")
+    parser.add_argument('filenames', nargs='+', metavar='filename',
+                        help="GAMESS output file(s); quoted globs such as '*.out' are expanded")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="neither read nor update the parse cache")
+    parser.add_argument('--cache-size', type=int, default=_CACHE_MAX_ENTRIES, metavar='N',
+                        help=f"keep at most N cached results (default {_CACHE_MAX_ENTRIES})")
+    args = parser.parse_args()
+
+    filenames = []
+    for name in args.filenames:
+        # Names the shell already expanded may contain glob characters such
+        # as '[' themselves; only non-existing names are treated as patterns
+        if os.path.exists(name):
+            filenames.append(name)
+        else:
+            filenames.extend(sorted(glob.glob(name)) or [name])
+    parse = partial(parse_one, use_cache=not args.no_cache)
+
+    # Parsing is CPU-bound Python, so many files are spread over processes
+    if len(filenames) == 1:
+        results = [parse(filenames[0])]
+    else:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(parse, filenames, chunksize=8))
+    # Evict once per run, after every file has been looked up
+    if not args.no_cache:
+        prune_cache(filenames, args.cache_size)
+
+    failed = False
+    for filename, (res, error) in zip(filenames, results):
+        if error:
+            print(error)
+            failed = True
+        else:
+            report(filename, res)
+    if failed:
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
     
@@ -9,175 +9,243 @@ Parse a GAMESS output file for:
   (6) EOM states from DIP-EOM, DEA-EOM, IP-EOM, or EA-EOM summary
 """
 
+import os
 import sys
+import stat
 import re
-
-def parse_reference_energy(lines):
+import mmap
+import numpy as np
+
+# GAMESS output is plain ASCII, so lines are handled as bytes throughout and
+# every pattern below is a bytes pattern; only extracted tokens are decoded.
+# Compiled once at import so repeated calls (e.g. batch parsing) never
+# recompile. Only the named group of each MASTER alternative captures, so
+# m.lastgroup tells which one matched. Patterns are written in upper case
+# and run against line.upper(), so no pattern needs re.IGNORECASE.
+_MASTER_PATTERNS = [
+    rb"(?:FINAL\s+(?:ROHF|UHF|HF)\s+ENERGY\s+IS\s+|\bREFERENCE ENERGY:\s+)(?P<ref>[-\d\.]+)",
+    rb"^\s*CCSD\s+ENERGY:\s+(?P<ccsd>[-\d\.]+)",
+    rb"THE\s+POINT\s+GROUP\s+OF\s+THE\s+MOLECULE\s+IS\s+(?P<pg>\S+)",
+    rb"THE\s+ORDER\s+OF\s+THE\s+PRINCIPAL\s+AXIS\s+IS\s+(?P<axis>\d+)",
+    rb"(?P<eom_summary>SUMMARY\s+OF\s+.*EOMCC\s+CALCULATIONS)",
+]
+_RE_MASTER = re.compile(b"|".join(b"(?:%s)" % pat for pat in _MASTER_PATTERNS))
+_RE_EOM_STATE = re.compile(rb"^\s*(\d+)\s+(\d+)\s+([-\d\.]+)\s+([-\d\.]+)\s+CONVERGED")
+# A whole row of irrep labels, validated in one match rather than per token
+_IRREP_TOKEN = rb"[AB]\d?[g-uG-U](?:\(\d+\))?"
+_RE_IRREP_LINE = re.compile(rb"%s(?:\s+%s)*" % (_IRREP_TOKEN, _IRREP_TOKEN))
+# A whole line of numbers (Fortran D exponents allowed); validating the line
+# with one match avoids a try/except float() per token on non-numeric rows.
+# Each token can match only one way, so a row that fails near its end does
+# not backtrack exponentially.
+_FLOAT_TOKEN = rb"[-+]?\d+(?:\.\d*)?(?:[EDed][-+]?\d+)?"
+_RE_FLOAT_LINE = re.compile(rb"%s(?:\s+%s)*" % (_FLOAT_TOKEN, _FLOAT_TOKEN))
+_D_TO_E = bytes.maketrans(b"Dd", b"Ee")
+# First byte of a stripped MO-block row decides which parser may accept it
+_FLOAT_FIRST = frozenset(b"-+.0123456789")
+_IRREP_FIRST = frozenset(b"AB")
+# Trailers that close the MO block (matched on the unstripped line so a
+# form feed is still visible), and how many unrecognized rows we tolerate
+_MO_END = re.compile(rb"[ \t]*(?:\f|\.{3,}|END OF|DONE WITH|SUMMARY OF|TOTAL TIMES)")
+_MO_MAX_UNMATCHED = 20
+# One record per converged EOM state
+_EOM_DTYPE = np.dtype([('state', 'i4'), ('spin', 'i4'), ('ion', 'f8'), ('tot', 'f8')])
+
+def _split_float_line(line):
     """
-    Parse the reference (SCF) energy from the file lines.
-    Returns: float or None
+    Check that a stripped line is a row of numbers. The tokens are kept as
+    bytes and converted together once the MO block has been read.
+    Returns: list of number tokens, or None if any token is not a number
     """
-    re_ref = re.compile(
-        r"(?:FINAL\s+(?:ROHF|UHF|HF)\s+ENERGY\s+IS\s+|\bREFERENCE ENERGY:\s+)([-\d\.]+)",
-        re.IGNORECASE
-    )
-    reference_energy = None
-
-    for line in lines:
-        m_ref = re_ref.search(line)
-        if m_ref:
-            reference_energy = float(m_ref.group(1))
-            break  # Stop after first match
+    if not _RE_FLOAT_LINE.fullmatch(line):
+        return None
+    return line.split()
 
-    return reference_energy
+def _line_is_irrep_list(raw):
+    # raw is the already stripped line
+    return _RE_IRREP_LINE.fullmatch(raw) is not None
 
-def parse_ccsd_energy(lines):
+def parse_all(lines):
     """
-    Parse the CCSD total energy from the file lines.
-    Returns: float or None
+    Parse everything in a single pass over the file lines (bytes).
+    Each line goes through one MASTER regex whose named groups (ref, ccsd,
+    pg, axis, eom_summary) say which quantity it carries; the MO block and
+    the EOM summary rows are handled by small state machines in the same loop.
+    Returns: (reference_energy, ccsd_energy, point_group,
+              mo_energies, mo_irreps, eom_states)
     """
-    re_ccsd = re.compile(r"^\s*CCSD\s+ENERGY:\s+([-\d\.]+)", re.IGNORECASE)
+    reference_energy = None
     ccsd_energy = None
-
-    for line in lines:
-        m_ccsd = re_ccsd.search(line)
-        if m_ccsd:
-            ccsd_energy = float(m_ccsd.group(1))
-            break  # Stop after first match
-
-    return ccsd_energy
-
-def parse_point_group(lines):
-    """
-    Parse the point group and the order of the principal axis (for 'N').
-    Returns: point_group (str or None), axis_order_str (str or None)
-    """
-    re_pg = re.compile(
-        r"THE\s+POINT\s+GROUP\s+OF\s+THE\s+MOLECULE\s+IS\s+(\S+)",
-        re.IGNORECASE
-    )
-    re_axis_order = re.compile(
-        r"THE\s+ORDER\s+OF\s+THE\s+PRINCIPAL\s+AXIS\s+IS\s+(\d+)",
-        re.IGNORECASE
-    )
-
     point_group = None
     axis_order_str = None
 
-    for line in lines:
-        m_pg = re_pg.search(line)
-        if m_pg:
-            point_group = m_pg.group(1).upper().strip()
-
-        m_ax = re_axis_order.search(line)
-        if m_ax:
-            axis_order_str = m_ax.group(1).strip()
-
-    # If there's an axis order, and the point_group has "N", replace it
-    if point_group and axis_order_str and "N" in point_group:
-        point_group = point_group.replace("N", axis_order_str)
-
-    return point_group
-
-def parse_mo_data(lines):
-    """
-    Parse the MO energies and irreps from the EIGENVECTOR or MOLECULAR ORBITALS block.
-    Returns: (mo_energies, mo_irreps), where each is a list.
-    """
-    # Regex helpers
-    irreps_pattern = re.compile(r"^[AB]\d?[g-uG-U](?:\(\d+\))?$")
-
-    def parse_float_line(line):
-        """Try parsing a line of floats (replacing D with E for exponents)."""
-        tokens = line.split()
-        floats = []
-        for t in tokens:
-            t_for_exp = t.replace('D', 'E')
-            try:
-                val = float(t_for_exp)
-                floats.append(val)
-            except ValueError:
-                return None
-        return floats
-
-    def line_is_irrep_list(line):
-        tokens = line.strip().split()
-        if not tokens:
-            return False
-        for tok in tokens:
-            if not irreps_pattern.match(tok):
-                return False
-        return True
-
-    mo_energies = []
+    energy_tokens = []
     mo_irreps = []
-
     in_mo_block = False
     energies_buffer = None
+    unmatched = 0
+
+    # Filled in place and doubled when full, then trimmed after the scan
+    eom_states = np.empty(16, dtype=_EOM_DTYPE)
+    n_eom = 0
+    in_eom_summary = False
 
     for line in lines:
         upper_line = line.upper()
 
-        # Detect beginning of MO block
-        if ("EIGENVECTOR" in upper_line) or ("MOLECULAR ORBITALS" in upper_line):
+        if in_eom_summary:
+            m_eom = _RE_EOM_STATE.match(upper_line)
+            if m_eom:
+                st_idx = int(m_eom.group(1))
+                sp_mult = int(m_eom.group(2))
+                ion_en = float(m_eom.group(3))
+                tot_en = float(m_eom.group(4))
+                if n_eom == len(eom_states):
+                    eom_states = np.concatenate((eom_states, np.empty_like(eom_states)))
+                eom_states[n_eom] = (st_idx, sp_mult, ion_en, tot_en)
+                n_eom += 1
+                continue
+            elif not line or line.isspace():
+                # blank line => maybe the summary ended
+                in_eom_summary = False
+
+        # Detect beginning of MO block (bytes.find is much cheaper than
+        # the "in" operator on bytes, and this runs on every line)
+        if upper_line.find(b"EIGENVECTOR") >= 0 or upper_line.find(b"MOLECULAR ORBITALS") >= 0:
             in_mo_block = True
             energies_buffer = None
+            unmatched = 0
+            continue
+
+        # Every MASTER alternative contains these literal words; checking them
+        # first keeps the (much slower) alternation off almost all lines.
+        # Each quantity appears once, so its words are dropped once it is found.
+        m = None
+        if (((reference_energy is None or ccsd_energy is None)
+                and upper_line.find(b"ENERGY") >= 0)
+                or (point_group is None and upper_line.find(b"POINT") >= 0
+                    and upper_line.find(b"GROUP") >= 0)
+                or (axis_order_str is None and upper_line.find(b"PRINCIPAL") >= 0
+                    and upper_line.find(b"AXIS") >= 0)
+                or (upper_line.find(b"SUMMARY") >= 0 and upper_line.find(b"EOMCC") >= 0)):
+            m = _RE_MASTER.search(upper_line)
+        if m:
+            key = m.lastgroup
+            if key == 'ref':
+                if reference_energy is None:  # Keep the first match
+                    reference_energy = float(m.group('ref'))
+            elif key == 'ccsd':
+                if ccsd_energy is None:  # Keep the first match
+                    ccsd_energy = float(m.group('ccsd'))
+            elif key == 'pg':
+                if point_group is None:  # Keep the first match
+                    point_group = m.group('pg').decode('ascii')
+            elif key == 'axis':
+                if axis_order_str is None:  # Keep the first match
+                    axis_order_str = m.group('axis').decode('ascii')
+            elif key == 'eom_summary':
+                # Detect EOM summary block
+                in_eom_summary = True
             continue
 
         if in_mo_block:
+            if _MO_END.match(upper_line):
+                # Left the MO section; stop scanning the rest of the file
+                in_mo_block = False
+                energies_buffer = None
+                continue
+
             raw = line.strip()
             if not raw:
                 # blank line => skip
                 continue
 
-            # Try to parse a line of floats
-            float_vals = parse_float_line(raw)
-            if float_vals is not None and len(float_vals) > 0:
-                energies_buffer = float_vals
+            first = raw[0]
+            if first in _FLOAT_FIRST:
+                # Try to read a line of floats
+                float_toks = _split_float_line(raw)
+                if float_toks is not None:
+                    energies_buffer = float_toks
+                    unmatched = 0
                 continue
 
             # If line looks like a list of irreps
-            if line_is_irrep_list(raw):
+            if first in _IRREP_FIRST and _line_is_irrep_list(raw):
                 tokens = raw.split()
                 # Only extend if energies_buffer and irreps have the same length
                 if energies_buffer and len(tokens) == len(energies_buffer):
-                    mo_energies.extend(energies_buffer)
-                    mo_irreps.extend(tokens)
+                    energy_tokens.extend(energies_buffer)
+                    mo_irreps.extend(tok.decode('ascii') for tok in tokens)
                 energies_buffer = None
+                unmatched = 0
                 continue
 
-    return mo_energies, mo_irreps
+            # Coefficient rows start with a digit and are skipped above, so
+            # a long run of other text means we are past the MO section
+            unmatched += 1
+            if unmatched > _MO_MAX_UNMATCHED:
+                in_mo_block = False
+                energies_buffer = None
 
-def parse_eom_states(lines):
+    # Convert every kept energy in one C call; D exponents are translated
+    # once over the joined row instead of per token
+    if energy_tokens:
+        mo_energies = np.fromstring(b" ".join(energy_tokens).translate(_D_TO_E), sep=" ")
+    else:
+        mo_energies = np.empty(0)
+
+    eom_states = eom_states[:n_eom].copy()
+
+    # If there's an axis order, and the point_group has "N", replace it
+    if point_group and axis_order_str and "N" in point_group:
+        point_group = point_group.replace("N", axis_order_str)
+
+    return reference_energy, ccsd_energy, point_group, mo_energies, mo_irreps, eom_states
+
+# The helpers below each run a full parse_all and keep one field. They are
+# kept for callers that want a single quantity; anything needing more than
+# one should call parse_all once instead of paying for several passes.
+def parse_energies(lines):
     """
-    Parse the EOM states (for DIP-EOM, DEA-EOM, IP-EOM, EA-EOM, etc.).
-    Returns: a list of tuples (state_index, spin, ion_en, total_en).
+    Parse the reference (SCF) energy and the CCSD total energy.
+    Returns: (reference_energy, ccsd_energy), each float or None
     """
-    re_eom_summary_begin = re.compile(r"SUMMARY\s+OF\s+.*EOMCC\s+CALCULATIONS", re.IGNORECASE)
-    re_eom_state = re.compile(r"^\s*(\d+)\s+(\d+)\s+([-\d\.]+)\s+([-\d\.]+)\s+CONVERGED", re.IGNORECASE)
+    return parse_all(lines)[:2]
 
-    eom_states = []
-    in_eom_summary = False
+def parse_reference_energy(lines):
+    """
+    Parse the reference (SCF) energy from the file lines.
+    Returns: float or None
+    """
+    return parse_energies(lines)[0]
 
-    for line in lines:
-        # Detect EOM summary block
-        if re_eom_summary_begin.search(line):
-            in_eom_summary = True
-            continue
+def parse_ccsd_energy(lines):
+    """
+    Parse the CCSD total energy from the file lines.
+    Returns: float or None
+    """
+    return parse_energies(lines)[1]
 
-        if in_eom_summary:
-            m_eom = re_eom_state.match(line)
-            if m_eom:
-                st_idx = int(m_eom.group(1))
-                sp_mult = int(m_eom.group(2))
-                ion_en = float(m_eom.group(3))
-                tot_en = float(m_eom.group(4))
-                eom_states.append((st_idx, sp_mult, ion_en, tot_en))
-            elif not line.strip():
-                # blank line => maybe the summary ended
-                in_eom_summary = False
+def parse_point_group(lines):
+    """
+    Parse the point group and the order of the principal axis (for 'N').
+    Returns: point_group (str or None), with 'N' replaced by the axis order
+    """
+    return parse_all(lines)[2]
+
+def parse_mo_data(lines):
+    """
+    Parse the MO energies and irreps from the EIGENVECTOR or MOLECULAR ORBITALS block.
+    Returns: (mo_energies, mo_irreps): a numpy array of energies and a list of irreps.
+    """
+    return parse_all(lines)[3:5]
 
-    return eom_states
+def parse_eom_states(lines):
+    """
+    Parse the EOM states (for DIP-EOM, DEA-EOM, IP-EOM, EA-EOM, etc.).
+    Returns: a structured numpy array with fields (state, spin, ion, tot).
+    """
+    return parse_all(lines)[5]
 
 def parse_gamess_output(filename):
     """
@@ -186,17 +254,15 @@ def parse_gamess_output(filename):
         mo_energies, mo_irreps, eom_states
     """
 
-    # Read all lines
-    with open(filename, 'r') as f:
-        lines = f.readlines()
-
-    ref_energy = parse_reference_energy(lines)
-    ccsd_energy = parse_ccsd_energy(lines)
-    point_group = parse_point_group(lines)
-    mo_energies, mo_irreps = parse_mo_data(lines)
-    eom_states = parse_eom_states(lines)
-
-    return ref_energy, ccsd_energy, point_group, mo_energies, mo_irreps, eom_states
+    # Map the file and feed its lines straight from the mapping: no text
+    # decoding and no list holding every line
+    with open(filename, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # mmap cannot map pipes, FIFOs or empty files; stream those
+            return parse_all(f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return parse_all(iter(buf.readline, b""))
 
 def main():
     if len(sys.argv) < 2:
@@ -237,7 +303,7 @@ def main():
 
     # 5) Print EOM states
     print("\n=== EOM States (for DIP, DEA, IP, EA, etc.) ===")
-    if not eom_states:
+    if len(eom_states) == 0:
         print("No EOM states found in output.")
     else:
         print(f"{'State':>5s}  {'Spin':>4s}  {'Ion_En (Ha)':>12s}  {'Total_E (Ha)':>14s}")